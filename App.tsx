@@ -1,8 +1,8 @@
 
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { AlertCircle, PieChart, Upload } from 'lucide-react';
 import { AppState, AnalysisResult, DocumentInputData, AVAILABLE_TEMPLATES } from './types';
-import { analyzeDocument, generateInfographicImage, generateInfographicPlan } from './services/gemini';
+import { analyzeDocument, generateInfographicImage, generateInfographicPlan, preloadBrandAssets } from './services/gemini';
 import { DocumentInput } from './components/DocumentInput';
 import { AnalysisView } from './components/AnalysisView';
 import { InfographicResult } from './components/InfographicResult';
@@ -22,6 +22,13 @@ const App: React.FC = () => {
   // Store original config
   const [pendingInputConfig, setPendingInputConfig] = useState<DocumentInputData | null>(null);
 
+  // Keep the selected template's brand assets warm while the user reviews the copy
+  useEffect(() => {
+    if (appState !== AppState.ANALYZING && appState !== AppState.REVIEW) return;
+    const template = AVAILABLE_TEMPLATES.find(t => t.id === selectedTemplateId) || AVAILABLE_TEMPLATES[0];
+    preloadBrandAssets(template.filename);
+  }, [appState, selectedTemplateId]);
+
   // STEP 1: Analyze Document -> Review State
   const handleAnalyze = async (input: DocumentInputData) => {
     console.log("[App] handleAnalyze called with:", input);
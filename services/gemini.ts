@@ -29,10 +29,36 @@ const BRAND_ASSETS: Record<string, {
     }
 };
 
+// A single SDK client for the session, so every call shares its config and the
+// browser's pooled keep-alive connections instead of rebuilding it per request.
+let sharedClient: GoogleGenAI | null = null;
+const getClient = (): GoogleGenAI => {
+    if (!sharedClient) sharedClient = new GoogleGenAI({ apiKey: process.env.API_KEY });
+    return sharedClient;
+};
+
+type BrandAssetConfig = typeof BRAND_ASSETS[string];
+type AssetPayload = {
+    data: string;
+    mimeType: string;
+    blob?: Blob; // Original bytes, kept so local re-encoding does not have to decode base64 again
+};
+
+/**
+ * Encode a Blob as base64 using the browser's native encoder (FileReader data URL)
+ * instead of building a binary string one char at a time and passing it to btoa.
+ */
+const blobToBase64 = (blob: Blob): Promise<string> => new Promise((resolve, reject) => {
+    const reader = new FileReader();
+    reader.onload = () => resolve((reader.result as string).split(',')[1] || '');
+    reader.onerror = () => reject(reader.error);
+    reader.readAsDataURL(blob);
+});
+
 /**
  * Helper to fetch and convert an asset file (Image or PDF) to base64
  */
-const fetchAssetAsBase64 = async (path: string): Promise<{ data: string, mimeType: string } | null> => {
+const fetchAssetAsBase64 = async (path: string): Promise<AssetPayload | null> => {
     try {
         console.log(`[Asset] Fetching: ${path}`);
         const response = await fetch(path);
@@ -43,34 +69,204 @@ const fetchAssetAsBase64 = async (path: string): Promise<{ data: string, mimeTyp
         
         const contentType = response.headers.get('content-type');
         if (contentType && contentType.includes('text/html')) {
+            // SPA fallback page, not the asset: abort the transfer instead of leaving it running
+            response.body?.cancel();
             return null;
         }
 
         const blob = await response.blob();
-        const buffer = await blob.arrayBuffer();
-        const bytes = new Uint8Array(buffer);
-        let binary = '';
-        for (let i = 0; i < bytes.byteLength; i++) binary += String.fromCharCode(bytes[i]);
-        const base64 = btoa(binary);
+        const base64 = await blobToBase64(blob);
         
         let mimeType = contentType || 'image/png';
         if (path.endsWith('.pdf')) mimeType = 'application/pdf';
         else if (path.endsWith('.jpg') || path.endsWith('.jpeg')) mimeType = 'image/jpeg';
         else if (path.endsWith('.png')) mimeType = 'image/png';
         
-        return { data: base64, mimeType };
+        return { data: base64, mimeType, blob };
     } catch (e) {
         console.warn(`[Asset] Error fetching ${path}:`, e);
         return null;
     }
 };
 
+// Brand assets are static for the whole session. Keep the in-flight promise per path so
+// the early preload, the planner and the artist all share a single download.
+const assetCache = new Map<string, Promise<AssetPayload | null>>();
+
+const loadAsset = (path: string): Promise<AssetPayload | null> => {
+    let pending = assetCache.get(path);
+    if (!pending) {
+        pending = fetchAssetAsBase64(path);
+        assetCache.set(path, pending);
+        // Do not pin failures; a later step should get a chance to retry.
+        pending.then(result => { if (!result) assetCache.delete(path); });
+    }
+    return pending;
+};
+
+// Template file name (e.g. 'aa_bg.png') -> BRAND_ASSETS key, built once instead of
+// scanning every brand's templatePath on each lookup.
+const BRAND_KEY_BY_TEMPLATE: Record<string, string> = Object.fromEntries(
+    Object.entries(BRAND_ASSETS).map(([key, config]) => [config.templatePath.split('/').pop() as string, key])
+);
+
+const resolveBrandAssets = (templateFileName?: string): BrandAssetConfig => {
+    const assetKey = (templateFileName && BRAND_KEY_BY_TEMPLATE[templateFileName]) || 'ns_black';
+    return BRAND_ASSETS[assetKey];
+};
+
+const loadBrandAssets = (assets: BrandAssetConfig) => Promise.all([
+    loadAsset(assets.logoPath),
+    loadAsset(assets.templatePath)
+]);
+
+/**
+ * PIPELINE: Start downloading the brand assets for a template while the user is still
+ * in the analysis/review steps, so generation does not wait on the network.
+ */
+export const preloadBrandAssets = (templateFileName?: string): void => {
+    void loadBrandAssets(resolveBrandAssets(templateFileName));
+};
+
+// Understanding-only calls (the planner) do not need full-resolution references: the model
+// resizes large images internally anyway, so the extra pixels only cost upload bytes.
+const VLM_MAX_EDGE = 1024;
+const VLM_JPEG_QUALITY = 0.85;
+
+const decodeBase64Prefix = (data: string, byteCount: number): Uint8Array => {
+    const binary = atob(data.slice(0, Math.ceil(byteCount / 3) * 4));
+    return Uint8Array.from(binary, c => c.charCodeAt(0));
+};
+
+const PNG_SIGNATURE = [0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A];
+const IHDR_TYPE = [0x49, 0x48, 0x44, 0x52]; // 'IHDR'
+const MAX_PROBED_EDGE = 65535;
+
+const hasBytesAt = (bytes: Uint8Array, offset: number, expected: number[]): boolean =>
+    expected.every((byte, i) => bytes[offset + i] === byte);
+
+// Header values feed straight into decoder allocation sizes, so reject anything implausible
+const plausibleSize = (width: number, height: number): { width: number, height: number } | null =>
+    width > 0 && height > 0 && width <= MAX_PROBED_EDGE && height <= MAX_PROBED_EDGE ? { width, height } : null;
+
+/**
+ * Read image dimensions from the file header only (PNG IHDR / JPEG SOFn), without
+ * spinning up a decoder. Returns null for anything else so callers fall back to decoding.
+ */
+const probeImageSize = (asset: AssetPayload): { width: number, height: number } | null => {
+    try {
+        if (asset.mimeType === 'image/png') {
+            const header = decodeBase64Prefix(asset.data, 24);
+            // The MIME type comes from the file extension, so verify this really is a PNG
+            if (header.length < 24 || !hasBytesAt(header, 0, PNG_SIGNATURE) || !hasBytesAt(header, 12, IHDR_TYPE)) return null;
+            const view = new DataView(header.buffer);
+            return plausibleSize(view.getUint32(16), view.getUint32(20));
+        }
+        if (asset.mimeType === 'image/jpeg') {
+            const bytes = decodeBase64Prefix(asset.data, 64 * 1024);
+            if (bytes[0] !== 0xFF || bytes[1] !== 0xD8) return null;
+            let offset = 2; // Skip SOI
+            while (offset < bytes.length && bytes[offset] === 0xFF) {
+                // Markers may be preceded by any number of 0xFF fill bytes
+                while (bytes[offset + 1] === 0xFF) offset++;
+                if (offset + 9 >= bytes.length) break;
+                const marker = bytes[offset + 1];
+                // SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+                if (marker >= 0xC0 && marker <= 0xCF && marker !== 0xC4 && marker !== 0xC8 && marker !== 0xCC) {
+                    return plausibleSize(
+                        (bytes[offset + 7] << 8) | bytes[offset + 8],
+                        (bytes[offset + 5] << 8) | bytes[offset + 6]
+                    );
+                }
+                offset += 2 + ((bytes[offset + 2] << 8) | bytes[offset + 3]);
+            }
+        }
+    } catch (e) {}
+    return null;
+};
+
+/**
+ * Downscale an image asset to VLM_MAX_EDGE and re-encode it for upload. JPEG is the
+ * default (far cheaper than PNG's deflate); pass 'image/png' for assets that need alpha.
+ * The cached original is left untouched; non-images and failures pass through as-is.
+ */
+const downscaleForVlm = async (
+    asset: AssetPayload,
+    format: 'image/jpeg' | 'image/png' = 'image/jpeg'
+): Promise<AssetPayload> => {
+    if (!asset.mimeType.startsWith('image/')) return asset;
+
+    // Already small enough? Then skip the decode/re-encode entirely.
+    const size = probeImageSize(asset);
+    if (size && Math.max(size.width, size.height) <= VLM_MAX_EDGE) return asset;
+
+    try {
+        const source = asset.blob ?? await (await fetch(`data:${asset.mimeType};base64,${asset.data}`)).blob();
+        let bitmap: ImageBitmap;
+        if (size) {
+            // Header size known: have createImageBitmap scale to the target while decoding.
+            // Only the long edge is pinned so the browser keeps the aspect ratio after any
+            // EXIF rotation (the header size is pre-rotation); the canvas below trims the rest.
+            const resizeEdge = size.width >= size.height
+                ? { resizeWidth: VLM_MAX_EDGE }
+                : { resizeHeight: VLM_MAX_EDGE };
+            bitmap = await createImageBitmap(source, { ...resizeEdge, resizeQuality: 'high' });
+        } else {
+            bitmap = await createImageBitmap(source);
+            if (Math.max(bitmap.width, bitmap.height) <= VLM_MAX_EDGE) {
+                bitmap.close();
+                return asset;
+            }
+        }
+
+        const scale = Math.min(1, VLM_MAX_EDGE / Math.max(bitmap.width, bitmap.height));
+        const canvas = new OffscreenCanvas(Math.round(bitmap.width * scale), Math.round(bitmap.height * scale));
+        const ctx = canvas.getContext('2d');
+        if (!ctx) {
+            bitmap.close();
+            return asset;
+        }
+        ctx.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+        bitmap.close();
+
+        const resized = await canvas.convertToBlob(
+            format === 'image/jpeg' ? { type: format, quality: VLM_JPEG_QUALITY } : { type: format }
+        );
+        return { data: await blobToBase64(resized), mimeType: resized.type || format };
+    } catch (e) {
+        console.warn('[Asset] Downscale failed, sending original:', e);
+        return asset;
+    }
+};
+
+// Downscaled previews are as static as their originals; memoize them per path and format
+// so a regenerate does not decode, re-encode and base64 the same template again.
+const previewCache = new Map<string, Promise<AssetPayload | null>>();
+
+const loadPreview = (path: string, format: 'image/jpeg' | 'image/png' = 'image/jpeg'): Promise<AssetPayload | null> => {
+    const cacheKey = `${format}:${path}`;
+    let pending = previewCache.get(cacheKey);
+    if (!pending) {
+        pending = loadAsset(path).then(asset => asset && downscaleForVlm(asset, format));
+        previewCache.set(cacheKey, pending);
+        pending.then(result => { if (!result) previewCache.delete(cacheKey); });
+    }
+    return pending;
+};
+
 /**
  * Robust JSON Parser with Auto-Repair for truncated responses
  */
 const safeJsonParse = (text: string): any => {
     if (!text) return {};
 
+    // 0. Fast path: JSON-mode responses are normally a bare object, so parse them
+    //    directly instead of running the cleanup regexes over the whole payload.
+    const trimmed = text.trim();
+    if (trimmed.startsWith('{') && trimmed.endsWith('}')) {
+        try { return JSON.parse(trimmed); } catch (e) {}
+    }
+
     // 1. Remove Markdown code blocks if present
     let clean = text.replace(/```json\s*/g, '').replace(/```\s*$/g, '');
     
@@ -151,7 +347,7 @@ const determineIntent = async (input: DocumentInputData): Promise<AnalysisMode>
 
     // 4. Robust Text Classification via LLM
     try {
-        const ai = new GoogleGenAI({ apiKey: process.env.API_KEY });
+        const ai = getClient();
         const response = await ai.models.generateContent({
             model: "gemini-2.5-flash",
             config: {
@@ -198,7 +394,7 @@ const determineIntent = async (input: DocumentInputData): Promise<AnalysisMode>
  * MAIN: Analyze Document (Text or File) with Retry Logic
  */
 export const analyzeDocument = async (input: DocumentInputData, language: Language = 'en'): Promise<AnalysisResult> => {
-    const ai = new GoogleGenAI({ apiKey: process.env.API_KEY });
+    const ai = getClient();
     const modelId = "gemini-2.5-flash"; // Fast, structured model
 
     // 1. Determine Intent
@@ -332,16 +528,17 @@ export const generateInfographicPlan = async (
     visualConfig: { aspectRatio: string },
     language: Language = 'en'
 ): Promise<string> => {
-    const ai = new GoogleGenAI({ apiKey: process.env.API_KEY });
+    const ai = getClient();
     const modelId = "gemini-2.5-flash";
 
-    let assetKey = Object.keys(BRAND_ASSETS).find(key => BRAND_ASSETS[key].templatePath.includes(templateConfig.fileName || '')) || 'ns_black';
-    const assets = BRAND_ASSETS[assetKey];
+    const assets = resolveBrandAssets(templateConfig.fileName);
     console.log(`[Planner] Using assets for: ${assets.name}`);
 
+    // The planner only has to understand the assets, so reduced previews are enough.
+    // Logos stay PNG so their transparency survives.
     const [logo, templateRef] = await Promise.all([
-        fetchAssetAsBase64(assets.logoPath),
-        fetchAssetAsBase64(assets.templatePath)
+        loadPreview(assets.logoPath, 'image/png'),
+        loadPreview(assets.templatePath)
     ]);
 
     const ratio = visualConfig.aspectRatio || '3:4';
@@ -435,20 +632,16 @@ export const generateInfographicImage = async (
     language: Language = 'en',
     planText?: string
 ): Promise<string[]> => {
-    const ai = new GoogleGenAI({ apiKey: process.env.API_KEY });
+    const ai = getClient();
     const model = "gemini-3-pro-image-preview"; // Use Pro for highest visual quality
 
     // 1. Resolve Assets
-    let assetKey = Object.keys(BRAND_ASSETS).find(key => BRAND_ASSETS[key].templatePath.includes(templateConfig.fileName || '')) || 'ns_black';
-    const assets = BRAND_ASSETS[assetKey];
+    const assets = resolveBrandAssets(templateConfig.fileName);
     
     console.log(`[Artist] Using assets for: ${assets.name}`);
 
-    // Load assets (Logo + Template)
-    const [logo, templateRef] = await Promise.all([
-        fetchAssetAsBase64(assets.logoPath),
-        fetchAssetAsBase64(assets.templatePath)
-    ]);
+    // Load assets (Logo + Template) - usually already warm from the preload/planner step
+    const [logo, templateRef] = await loadBrandAssets(assets);
 
     // 2. Construct Prompt with Explicit Indexing for Robustness
     const parts: any[] = [];
@@ -22,7 +22,7 @@ export interface DocumentInputData {
   
   // Visual Configuration
   aspectRatio?: string; // '1:1', '3:4', '4:3', '9:16', '16:9'
-  imageSize?: string; // '1K', '2K'
+  imageSize?: string; // '1K', '2K', '4K'
 }
 
 export interface KeyPoint {